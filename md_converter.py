@@ -3,29 +3,60 @@
 import sys
 import os
 import re
+import collections
+import functools
+import itertools
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
-import openpyxl
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-from docx import Document
-from docx.shared import Pt, Inches, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-
 
 # ─── Markdown Parser ────────────────────────────────────────────────────────
 
-class MDBlock:
-    """Parsed markdown block."""
-    def __init__(self, kind, content, level=0):
-        self.kind = kind        # "heading", "table", "paragraph", "list", "code", "hr"
-        self.content = content  # str or list (table rows)
-        self.level = level      # heading level (1-6) or list nesting
+# block-level patterns (one alternation per line, dispatched on lastgroup).
+# Sub-patterns are written so no two quantifiers can consume the same text,
+# which keeps matching linear on long or malformed lines.
+_RE_BLOCK_START = re.compile(
+    r"(?P<heading>(?P<hashes>#{1,6})\s+(?P<title>\S(?:.*\S)?)\s*$)"
+    r"|(?P<hr>[ \t]{0,3}(?:(?:\*[ \t]*){3,}|(?:-[ \t]*){3,}|(?:_[ \t]*){3,})$)"
+    r"|(?P<fence>\s*```)"
+    r"|(?P<list>(?P<indent>\s*)(?P<marker>[-*+]|\d+\.)\s+(?P<item>.*))"
+)
+_RE_TABLE_SEP = re.compile(r"^\|?[\s\-:|]+\|")
+
+# <br> tags become newlines before inline stripping, so the [^...\n] bodies
+# below cannot join text across a break
+_RE_BR = re.compile(r"<br\s*/?>", re.IGNORECASE)
+
+# inline patterns (one alternation, unwrapped by _strip_inline_repl).
+# Delimited bodies exclude their own delimiters (and <a> bodies stop at the
+# next tag), so an unclosed opener scans no further than the next opener.
+# sub() never revisits matched text, so nesting is spelled out: *** / ___
+# come before bold, bold may end in an inner italic (**a *b***), italic may
+# contain bold (*a **b***), and italic never closes on the first char of a
+# bold pair (file_name and __dunder__). No construct spans a line break.
+_RE_INLINE = re.compile(
+    r"(?P<strong>\*\*\*([^*\n]+)\*\*\*|___([^_\n]+)___)"
+    r"|(?P<bold>\*\*([^*\n]+(?:\*(?!\*)[^*\n]*)*\*?)\*\*|__([^_\n]+(?:_(?!_)[^_\n]*)*_?)__)"
+    r"|(?P<ital>\*((?:[^*\n]|\*\*[^*\n]+\*\*)+)\*(?!\*)|_((?:[^_\n]|__[^_\n]+__)+)_(?!_))"
+    r"|(?P<code>`([^`\n]+)`)"
+    r"|(?P<link>\[([^\[\]\n]+)\]\((?:[^()\n]|\([^()\n]*\))+\))"
+    r"|(?P<atag><a\s[^<>]*>((?:(?!</?a[\s>]).)*)</a>)",
+    re.IGNORECASE,
+)
+# characters that can start an inline construct; text without any is returned as-is
+_INLINE_MARKERS = "*_`[<"
+
 
+# Parsed markdown block:
+#   kind     "heading", "table", "paragraph", "list", "code", "hr"
+#   content  str or list (table rows)
+#   level    heading level (1-6) or list nesting
+MDBlock = collections.namedtuple("MDBlock", "kind content level", defaults=(0,))
 
-def parse_md(text: str) -> list[MDBlock]:
-    """Parse markdown text into a list of blocks."""
-    lines = text.split("\n")
-    blocks: list[MDBlock] = []
+
+def parse_md(text: str) -> Iterator[MDBlock]:
+    """Parse markdown text, yielding blocks in document order."""
+    lines = text.splitlines()
     i = 0
 
     while i < len(lines):
@@ -36,231 +67,258 @@ def parse_md(text: str) -> list[MDBlock]:
             i += 1
             continue
 
+        m = _RE_BLOCK_START.match(line)
+        kind = m.lastgroup if m else None
+
         # heading (ATX style)
-        m = re.match(r"^(#{1,6})\s+(.+)$", line)
-        if m:
-            level = len(m.group(1))
-            blocks.append(MDBlock("heading", m.group(2).strip(), level))
+        if kind == "heading":
+            level = len(m.group("hashes"))
+            yield MDBlock("heading", m.group("title").strip(), level)
             i += 1
             continue
 
         # horizontal rule
-        if re.match(r"^(\*{3,}|-{3,}|_{3,})\s*$", line):
-            blocks.append(MDBlock("hr", ""))
+        if kind == "hr":
+            yield MDBlock("hr", "")
             i += 1
             continue
 
         # fenced code block
-        if line.strip().startswith("```"):
+        if kind == "fence":
             code_lines = []
             i += 1
             while i < len(lines) and not lines[i].strip().startswith("```"):
                 code_lines.append(lines[i])
                 i += 1
             i += 1  # skip closing ```
-            blocks.append(MDBlock("code", "\n".join(code_lines)))
+            yield MDBlock("code", "\n".join(code_lines))
             continue
 
         # table
-        if "|" in line and i + 1 < len(lines) and re.match(r"^\|?[\s\-:|]+\|", lines[i + 1]):
+        if "|" in line and i + 1 < len(lines) and _RE_TABLE_SEP.match(lines[i + 1]):
             table_rows = []
             # header row
             table_rows.append(_parse_table_row(line))
             i += 1  # skip separator line
             i += 1
-            while i < len(lines) and "|" in lines[i] and lines[i].strip():
+            # a line containing "|" is never blank, so no separate strip() check
+            while i < len(lines) and "|" in lines[i]:
                 table_rows.append(_parse_table_row(lines[i]))
                 i += 1
-            blocks.append(MDBlock("table", table_rows))
-            continue
-
-        # unordered list
-        if re.match(r"^(\s*)([-*+])\s+", line):
-            list_items = []
-            while i < len(lines) and re.match(r"^(\s*)([-*+])\s+", lines[i]):
-                m = re.match(r"^(\s*)([-*+])\s+(.+)$", lines[i])
-                indent = len(m.group(1))
-                list_items.append((indent, m.group(3).strip()))
-                i += 1
-            blocks.append(MDBlock("list", list_items))
+            yield MDBlock("table", table_rows)
             continue
 
-        # ordered list
-        if re.match(r"^(\s*)\d+\.\s+", line):
+        # list (unordered or ordered); a change of marker type starts a new list
+        if kind == "list":
+            ordered = m.group("marker")[0].isdigit()
             list_items = []
-            while i < len(lines) and re.match(r"^(\s*)\d+\.\s+", lines[i]):
-                m = re.match(r"^(\s*)\d+\.\s+(.+)$", lines[i])
-                indent = len(m.group(1))
-                list_items.append((indent, m.group(2).strip()))
+            while (
+                i < len(lines)
+                and (m := _RE_BLOCK_START.match(lines[i]))
+                and m.lastgroup == "list"
+                and m.group("marker")[0].isdigit() == ordered
+            ):
+                list_items.append((len(m.group("indent")), m.group("item").strip()))
                 i += 1
-            blocks.append(MDBlock("list", list_items))
+            yield MDBlock("list", list_items)
             continue
 
-        # paragraph (collect consecutive non-empty lines)
-        para_lines = []
-        while i < len(lines) and lines[i].strip() and not _is_special_line(lines[i], lines, i):
-            para_lines.append(lines[i].strip())
+        # paragraph (collect consecutive non-empty lines); the current line
+        # already failed every block test above, so only later lines are checked
+        para_lines = [line.strip()]
+        i += 1
+        while i < len(lines):
+            stripped = lines[i].strip()
+            if not stripped or _is_special_line(lines[i], lines, i):
+                break
+            para_lines.append(stripped)
             i += 1
-        if para_lines:
-            blocks.append(MDBlock("paragraph", " ".join(para_lines)))
-
-    return blocks
+        yield MDBlock("paragraph", " ".join(para_lines))
 
 
 def _parse_table_row(line: str) -> list[str]:
     """Parse a markdown table row into cells."""
-    line = line.strip()
-    if line.startswith("|"):
-        line = line[1:]
-    if line.endswith("|"):
-        line = line[:-1]
-    return [cell.strip() for cell in line.split("|")]
+    s = line.strip()
+    start = 1 if s[:1] == "|" else 0
+    end = -1 if s[-1:] == "|" else len(s)
+    return [cell.strip() for cell in s[start:end].split("|")]
 
 
 def _is_special_line(line: str, lines: list[str], i: int) -> bool:
     """Check if a line starts a new special block."""
-    if re.match(r"^#{1,6}\s+", line):
-        return True
-    if re.match(r"^(\*{3,}|-{3,}|_{3,})\s*$", line):
-        return True
-    if line.strip().startswith("```"):
-        return True
-    if "|" in line and i + 1 < len(lines) and re.match(r"^\|?[\s\-:|]+\|", lines[i + 1]):
+    if _RE_BLOCK_START.match(line):
         return True
-    if re.match(r"^(\s*)([-*+])\s+", line):
-        return True
-    if re.match(r"^(\s*)\d+\.\s+", line):
-        return True
-    return False
+    return bool("|" in line and i + 1 < len(lines) and _RE_TABLE_SEP.match(lines[i + 1]))
 
 
+@functools.lru_cache(maxsize=4096)
 def strip_inline_md(text: str) -> str:
     """Remove inline markdown formatting (bold, italic, code, links).
     Converts <br> / <br/> / <br /> tags to newlines."""
-    text = re.sub(r"<br\s*/?>", "\n", text, flags=re.IGNORECASE)
-    text = re.sub(r"\*\*(.+?)\*\*", r"\1", text)
-    text = re.sub(r"__(.+?)__", r"\1", text)
-    text = re.sub(r"\*(.+?)\*", r"\1", text)
-    text = re.sub(r"_(.+?)_", r"\1", text)
-    text = re.sub(r"`(.+?)`", r"\1", text)
-    text = re.sub(r"\[(.+?)\]\(.+?\)", r"\1", text)
-    text = re.sub(r'<a\s[^>]*?>(.*?)</a>', r"\1", text, flags=re.IGNORECASE)
-    return text
+    if not any(c in text for c in _INLINE_MARKERS):
+        return text
+    if "<" in text:
+        text = _RE_BR.sub("\n", text)
+    return _RE_INLINE.sub(_strip_inline_repl, text)
 
 
-# ─── Excel Exporter ─────────────────────────────────────────────────────────
+def _strip_inline_repl(m: re.Match) -> str:
+    """Replace one inline construct with its (recursively stripped) inner text."""
+    inner = next(g for g in m.groups()[m.lastindex:] if g is not None)
+    return _RE_INLINE.sub(_strip_inline_repl, inner)
 
-HEADING_FILLS = {
-    1: PatternFill(start_color="1F4E79", end_color="1F4E79", fill_type="solid"),
-    2: PatternFill(start_color="2E75B6", end_color="2E75B6", fill_type="solid"),
-    3: PatternFill(start_color="9DC3E6", end_color="9DC3E6", fill_type="solid"),
-}
-
-HEADING_FONTS = {
-    1: Font(name="Yu Gothic", size=16, bold=True, color="FFFFFF"),
-    2: Font(name="Yu Gothic", size=14, bold=True, color="FFFFFF"),
-    3: Font(name="Yu Gothic", size=12, bold=True, color="1F4E79"),
-    4: Font(name="Yu Gothic", size=11, bold=True),
-    5: Font(name="Yu Gothic", size=10, bold=True),
-    6: Font(name="Yu Gothic", size=10, bold=True, italic=True),
-}
-
-THIN_BORDER = Border(
-    left=Side(style="thin"),
-    right=Side(style="thin"),
-    top=Side(style="thin"),
-    bottom=Side(style="thin"),
-)
 
-TABLE_HEADER_FILL = PatternFill(start_color="D6E4F0", end_color="D6E4F0", fill_type="solid")
-TABLE_HEADER_FONT = Font(name="Yu Gothic", size=10, bold=True)
-TABLE_BODY_FONT = Font(name="Yu Gothic", size=10)
-BODY_FONT = Font(name="Yu Gothic", size=10)
-CODE_FONT = Font(name="Consolas", size=9)
-CODE_FILL = PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
+# ─── Excel Exporter ─────────────────────────────────────────────────────────
+
+_ExcelStyles = collections.namedtuple("_ExcelStyles", [
+    "heading_fills", "heading_fonts", "thin_border",
+    "table_header_fill", "table_header_font", "table_body_font",
+    "body_font", "code_font", "code_fill", "hr_border",
+    "align_center", "align_wrap_center", "align_nowrap",
+])
+
+
+@functools.lru_cache(maxsize=1)
+def _excel_styles() -> _ExcelStyles:
+    """Build the shared Excel style objects (imports openpyxl on first use)."""
+    from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+
+    return _ExcelStyles(
+        heading_fills={
+            1: PatternFill(start_color="1F4E79", end_color="1F4E79", fill_type="solid"),
+            2: PatternFill(start_color="2E75B6", end_color="2E75B6", fill_type="solid"),
+            3: PatternFill(start_color="9DC3E6", end_color="9DC3E6", fill_type="solid"),
+        },
+        heading_fonts={
+            1: Font(name="Yu Gothic", size=16, bold=True, color="FFFFFF"),
+            2: Font(name="Yu Gothic", size=14, bold=True, color="FFFFFF"),
+            3: Font(name="Yu Gothic", size=12, bold=True, color="1F4E79"),
+            4: Font(name="Yu Gothic", size=11, bold=True),
+            5: Font(name="Yu Gothic", size=10, bold=True),
+            6: Font(name="Yu Gothic", size=10, bold=True, italic=True),
+        },
+        thin_border=Border(
+            left=Side(style="thin"),
+            right=Side(style="thin"),
+            top=Side(style="thin"),
+            bottom=Side(style="thin"),
+        ),
+        table_header_fill=PatternFill(start_color="D6E4F0", end_color="D6E4F0", fill_type="solid"),
+        table_header_font=Font(name="Yu Gothic", size=10, bold=True),
+        table_body_font=Font(name="Yu Gothic", size=10),
+        body_font=Font(name="Yu Gothic", size=10),
+        code_font=Font(name="Consolas", size=9),
+        code_fill=PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid"),
+        hr_border=Border(bottom=Side(style="medium", color="888888")),
+        align_center=Alignment(vertical="center"),
+        align_wrap_center=Alignment(wrap_text=True, vertical="center"),
+        align_nowrap=Alignment(wrap_text=False),
+    )
 
 
-def export_to_excel(blocks: list[MDBlock], output_path: str):
+def export_to_excel(blocks: Iterable[MDBlock], output_path: str):
     """Export parsed markdown blocks to an Excel file."""
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "Markdown"
+    import openpyxl
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.utils import get_column_letter
+
+    st = _excel_styles()
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("Markdown")
     ws.sheet_properties.outlinePr = openpyxl.worksheet.properties.Outline(
         summaryBelow=False, summaryRight=False
     )
 
-    row = 1
+    # write-only sheets emit column widths before the first row,
+    # so rows are collected first and appended once widths are known
+    rows: list[list[WriteOnlyCell]] = []
+    col_max_len: dict[int, int] = {}
+
+    def styled_cell(value=None, font=None, fill=None, border=None, alignment=None):
+        """Create a write-only cell with the given styles applied."""
+        cell = WriteOnlyCell(ws, value=value)
+        if font is not None:
+            cell.font = font
+        if fill is not None:
+            cell.fill = fill
+        if border is not None:
+            cell.border = border
+        if alignment is not None:
+            cell.alignment = alignment
+        return cell
+
+    def add_row(cells):
+        """Queue a row, tracking the longest value seen in each column."""
+        for col, cell in enumerate(cells, 1):
+            length = len(str(cell.value)) if cell.value else 0
+            col_max_len[col] = max(col_max_len.get(col, 0), length)
+        rows.append(cells)
 
     for block in blocks:
         if block.kind == "heading":
             level = block.level
             text = strip_inline_md(block.content)
-            cell = ws.cell(row=row, column=1, value=text)
-            cell.font = HEADING_FONTS.get(level, HEADING_FONTS[6])
-            if level in HEADING_FILLS:
-                for col in range(1, 8):
-                    ws.cell(row=row, column=col).fill = HEADING_FILLS[level]
-            cell.alignment = Alignment(vertical="center")
-            ws.row_dimensions[row].height = 28 if level <= 2 else 22
-            row += 1
+            fill = st.heading_fills.get(level)
+            cells = [styled_cell(
+                text,
+                font=st.heading_fonts.get(level, st.heading_fonts[6]),
+                fill=fill,
+                alignment=st.align_center,
+            )]
+            if fill is not None:
+                cells += [styled_cell(fill=fill) for _ in range(2, 8)]
+            ws.row_dimensions[len(rows) + 1].height = 28 if level <= 2 else 22
+            add_row(cells)
 
         elif block.kind == "table":
             table_rows = block.content
             if not table_rows:
                 continue
-            num_cols = max(len(r) for r in table_rows)
             for ri, trow in enumerate(table_rows):
-                for ci, cell_text in enumerate(trow):
-                    cell = ws.cell(row=row, column=ci + 1, value=strip_inline_md(cell_text))
-                    cell.border = THIN_BORDER
-                    cell.alignment = Alignment(wrap_text=True, vertical="center")
-                    if ri == 0:
-                        cell.fill = TABLE_HEADER_FILL
-                        cell.font = TABLE_HEADER_FONT
-                    else:
-                        cell.font = TABLE_BODY_FONT
-                row += 1
-            row += 1  # blank row after table
+                # one style set per row, one append per row
+                font = st.table_header_font if ri == 0 else st.table_body_font
+                fill = st.table_header_fill if ri == 0 else None
+                add_row([
+                    styled_cell(
+                        strip_inline_md(cell_text),
+                        font=font, fill=fill, border=st.thin_border, alignment=st.align_wrap_center,
+                    )
+                    for cell_text in trow
+                ])
+            add_row([])  # blank row after table
 
         elif block.kind == "list":
             for indent, text in block.content:
                 prefix = "  " * (indent // 2) + "• "
-                cell = ws.cell(row=row, column=1, value=prefix + strip_inline_md(text))
-                cell.font = BODY_FONT
-                cell.alignment = Alignment(wrap_text=False)
-                row += 1
-            row += 1
+                add_row([styled_cell(
+                    prefix + strip_inline_md(text),
+                    font=st.body_font, alignment=st.align_nowrap,
+                )])
+            add_row([])
 
         elif block.kind == "code":
             for code_line in block.content.split("\n"):
-                cell = ws.cell(row=row, column=1, value=code_line)
-                cell.font = CODE_FONT
-                cell.fill = CODE_FILL
-                cell.alignment = Alignment(wrap_text=False)
-                row += 1
-            row += 1
+                add_row([styled_cell(
+                    code_line,
+                    font=st.code_font, fill=st.code_fill, alignment=st.align_nowrap,
+                )])
+            add_row([])
 
         elif block.kind == "hr":
-            for col in range(1, 8):
-                ws.cell(row=row, column=col).border = Border(
-                    bottom=Side(style="medium", color="888888")
-                )
-            row += 1
+            add_row([styled_cell(border=st.hr_border) for _ in range(1, 8)])
 
         elif block.kind == "paragraph":
-            cell = ws.cell(row=row, column=1, value=strip_inline_md(block.content))
-            cell.font = BODY_FONT
-            cell.alignment = Alignment(wrap_text=False)
-            row += 1
+            add_row([styled_cell(
+                strip_inline_md(block.content),
+                font=st.body_font, alignment=st.align_nowrap,
+            )])
 
     # auto-adjust column widths
-    for col_cells in ws.columns:
-        max_len = 0
-        col_letter = col_cells[0].column_letter
-        for cell in col_cells:
-            if cell.value:
-                max_len = max(max_len, len(str(cell.value)))
-        ws.column_dimensions[col_letter].width = min(max_len + 4, 60)
+    for col, max_len in col_max_len.items():
+        ws.column_dimensions[get_column_letter(col)].width = min(max_len + 4, 60)
+
+    for cells in rows:
+        ws.append(cells)
 
     wb.save(output_path)
     print(f"Excel exported: {output_path}")
@@ -268,8 +326,13 @@ def export_to_excel(blocks: list[MDBlock], output_path: str):
 
 # ─── Word Exporter ──────────────────────────────────────────────────────────
 
-def export_to_word(blocks: list[MDBlock], output_path: str):
+def export_to_word(blocks: Iterable[MDBlock], output_path: str):
     """Export parsed markdown blocks to a Word file."""
+    from docx import Document
+    from docx.oxml.ns import qn
+    from docx.shared import Pt, Inches
+    from lxml import etree
+
     doc = Document()
 
     # set default font
@@ -292,10 +355,8 @@ def export_to_word(blocks: list[MDBlock], output_path: str):
             table.style = "Table Grid"
             # auto-fit table to window width
             table.autofit = True
-            from docx.oxml.ns import qn
             tbl = table._tbl
             tbl_pr = tbl.tblPr if tbl.tblPr is not None else tbl._add_tblPr()
-            from lxml import etree
             # Remove fixed width, use auto layout
             for existing in tbl_pr.findall(qn("w:tblW")):
                 tbl_pr.remove(existing)
@@ -305,15 +366,12 @@ def export_to_word(blocks: list[MDBlock], output_path: str):
             for ri, trow in enumerate(table_rows):
                 for ci, cell_text in enumerate(trow):
                     cell = table.cell(ri, ci)
-                    text = strip_inline_md(cell_text)
-                    # Handle newlines (from <br>) as separate paragraphs in cell
-                    lines = text.split("\n")
-                    cell.text = lines[0]
-                    for extra_line in lines[1:]:
-                        cell.add_paragraph(extra_line)
-                    for paragraph in cell.paragraphs:
-                        for run in paragraph.runs:
-                            run.font.size = Pt(9)
+                    # newlines (from <br>) become <w:br/> inside a single run
+                    cell.text = strip_inline_md(cell_text)
+                    for run in cell.paragraphs[0].runs:
+                        run.font.size = Pt(9)
+                        if ri == 0:
+                            run.bold = True
                     if ri == 0:
                         tc_pr = cell._element.get_or_add_tcPr()
                         shading_elm = etree.SubElement(
@@ -324,9 +382,6 @@ def export_to_word(blocks: list[MDBlock], output_path: str):
                                 qn("w:fill"): "D6E4F0",
                             },
                         )
-                        for paragraph in cell.paragraphs:
-                            for run in paragraph.runs:
-                                run.bold = True
             doc.add_paragraph()  # spacing after table
 
         elif block.kind == "list":
@@ -340,8 +395,6 @@ def export_to_word(blocks: list[MDBlock], output_path: str):
             run.font.name = "Consolas"
             run.font.size = Pt(9)
             # light gray background via shading
-            from docx.oxml.ns import qn
-            from lxml import etree
             shd = etree.SubElement(
                 p._element.get_or_add_pPr(), qn("w:shd"),
                 attrib={
@@ -354,8 +407,6 @@ def export_to_word(blocks: list[MDBlock], output_path: str):
         elif block.kind == "hr":
             p = doc.add_paragraph()
             p_fmt = p.paragraph_format
-            from docx.oxml.ns import qn
-            from lxml import etree
             pPr = p._element.get_or_add_pPr()
             pBdr = etree.SubElement(pPr, qn("w:pBdr"))
             etree.SubElement(
@@ -369,11 +420,8 @@ def export_to_word(blocks: list[MDBlock], output_path: str):
             )
 
         elif block.kind == "paragraph":
-            text = strip_inline_md(block.content)
-            lines = text.split("\n")
-            p = doc.add_paragraph(lines[0])
-            for extra_line in lines[1:]:
-                p.add_run("\n" + extra_line)
+            # newlines (from <br>) become <w:br/> inside a single run
+            doc.add_paragraph(strip_inline_md(block.content))
 
     doc.save(output_path)
     print(f"Word exported: {output_path}")
@@ -411,15 +459,16 @@ def main():
         sys.exit(1)
 
     # read markdown
-    with open(md_path, encoding="utf-8") as f:
-        md_text = f.read()
+    md_text = Path(md_path).read_text(encoding="utf-8")
 
     # parse
     blocks = parse_md(md_text)
+    first = next(blocks, None)
 
-    if not blocks:
+    if first is None:
         print("エラー: Markdownの内容が空です。")
         sys.exit(1)
+    blocks = itertools.chain([first], blocks)
 
     # output path
     base = Path(md_path).stem